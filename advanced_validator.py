@@ -1,124 +1,325 @@
-import dns.resolver
-import phonenumbers
-from phonenumbers import NumberParseException, PhoneNumberFormat
-import validators
-import requests
+import asyncio
+from email_validator import validate_email, EmailNotValidError
 import re
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
-from difflib import SequenceMatcher
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz, process
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from datasketch import MinHash, MinHashLSH
 import time
 from urllib.parse import urlparse
 import socket
+import threading
+import functools
+from collections import OrderedDict
+
+# Disposable email domains to reject
+DISPOSABLE_DOMAINS = frozenset({
+    '10minutemail.com', 'tempmail.org', 'guerrillamail.com', 'mailinator.com',
+    'yopmail.com', 'temp-mail.org', 'throwaway.email', 'maildrop.cc',
+    'getnada.com', 'tempail.com', 'sharklasers.com', 'grr.la',
+    'fakeinbox.com', 'spamgourmet.com', 'dispostable.com', 'mailnesia.com'
+})
+
+# Invalid company name patterns
+SPAM_PATTERNS = (
+    r'test\s*company', r'example\s*corp', r'sample\s*ltd', r'dummy\s*business',
+    r'fake\s*enterprise', r'xxx+', r'aaa+', r'lorem\s*ipsum', r'john\s*doe',
+    r'company\s*name', r'business\s*here', r'enter\s*name', r'your\s*company'
+)
+
+# Validation score weights: company 20, email 30, phone 25, website 25
+# (MX and activity bonuses only occur alongside a valid email/website)
+VALIDATION_WEIGHTS = (
+    ('company_name_valid', 20),
+    ('email_valid', 20),
+    ('email_mx_valid', 10),
+    ('phone_valid', 25),
+    ('website_valid', 15),
+    ('website_active', 10),
+)
+
+# Regexes compiled once per process; all spam patterns are fused into a
+# single alternation so each name is scanned once
+_SPAM_RE = re.compile('|'.join(f'(?:{p})' for p in SPAM_PATTERNS), re.IGNORECASE)
+_ALPHA_RE = re.compile(r'[a-zA-Z]')
+_REPEAT_RE = re.compile(r'(.)\1{4,}')
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+
+# Deletes every non-digit ASCII character (applied after dropping non-ASCII)
+_DIGITS_ONLY = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+@functools.lru_cache(maxsize=4096)
+def _parse_phone_cached(cleaned_phone: str, region: Optional[str]) -> Optional[Tuple[bool, str, str]]:
+    """Parse a cleaned phone number; returns (is_valid, E.164, region code) or None if unparseable"""
+    # Imported on first use: loading the phonenumbers metadata is slow
+    import phonenumbers
+    from phonenumbers import NumberParseException, PhoneNumberFormat
+    
+    try:
+        parsed_number = phonenumbers.parse(cleaned_phone, region)
+    except NumberParseException:
+        return None
+    
+    if not phonenumbers.is_valid_number(parsed_number):
+        return False, '', ''
+    
+    return (
+        True,
+        phonenumbers.format_number(parsed_number, PhoneNumberFormat.E164),
+        phonenumbers.region_code_for_number(parsed_number)
+    )
+
+class _TTLCache:
+    """Thread-safe LRU mapping bounded to maxsize entries, each expiring after its own TTL"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()  # key -> (value, expires at)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Fresh value for the key (marking it recently used), or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store the value for ttl seconds, evicting expired and then least recently used entries"""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now + ttl)
+            self._entries.move_to_end(key)
+            
+            # Expired entries are dropped from the cold end; anything still over
+            # the bound is evicted least recently used first
+            while self._entries:
+                _, (_, expires_at) = next(iter(self._entries.items()))
+                if expires_at > now and len(self._entries) <= self.maxsize:
+                    break
+                self._entries.popitem(last=False)
 
 class AdvancedDataValidator:
-    """Advanced 100% validation system for turmeric buyer data"""
+    """Advanced 100% validation system for turmeric buyer data
+    
+    Instances only hold caches, the HTTP session and the DNS resolvers, and
+    are safe to share between threads (see get_default_validator).
+    """
+    
+    # Seconds an MX lookup result stays cached (negative answers expire sooner)
+    MX_CACHE_TTL = 3600
+    MX_NEGATIVE_CACHE_TTL = 300
+    MX_CACHE_SIZE = 10000
+    
+    # Token bucket on DNS queries actually issued (cache hits are free)
+    DNS_QUERIES_PER_SECOND = 50
+    DNS_BURST = 50
+    
+    # Resolver settings: short timeouts so one slow domain can't stall a batch
+    DNS_TIMEOUT = 2.0
+    DNS_LIFETIME = 4.0
+    DNS_NAMESERVERS = ['1.1.1.1', '8.8.8.8']
+    DNS_CACHE_SIZE = 10000
+    
+    # Seconds a website check stays cached per host (failed connections expire sooner)
+    SITE_CACHE_TTL = 3600
+    SITE_FAILURE_CACHE_TTL = 60
+    SITE_CACHE_SIZE = 10000
+    
+    HTTP_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    # HEAD responses meaning "method not supported": retry with a streamed GET
+    HEAD_UNSUPPORTED_STATUSES = frozenset({405, 501})
+    
+    # Fuzzy company-name dedup: names with at least FUZZY_NAME_THRESHOLD similarity
+    # are duplicates. Shingle Jaccard runs well below the edit-distance ratio for
+    # the same pair, so the LSH candidate threshold is set lower to keep recall.
+    FUZZY_NAME_THRESHOLD = 0.85
+    LSH_THRESHOLD = 0.5
+    LSH_NUM_PERM = 64
+    
+    # Candidate groups larger than this are scored per 3-character name prefix
+    MAX_CANDIDATE_GROUP = 500
+    
+    # Regions tried when a phone number carries no explicit '+' country code,
+    # and the leading digits that let one of them be tried first
+    PHONE_REGIONS = ('IN', 'US', 'GB', None)
+    COUNTRY_CODE_REGIONS = (('91', 'IN'), ('44', 'GB'), ('1', 'US'))
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Disposable email domains to reject
-        self.disposable_domains = {
-            '10minutemail.com', 'tempmail.org', 'guerrillamail.com', 'mailinator.com',
-            'yopmail.com', 'temp-mail.org', 'throwaway.email', 'maildrop.cc',
-            'getnada.com', 'tempail.com', 'sharklasers.com', 'grr.la',
-            'fakeinbox.com', 'spamgourmet.com', 'dispostable.com', 'mailnesia.com'
-        }
+        # domain -> (has MX record, reason), bounded and expiring
+        self._mx_cache = _TTLCache(self.MX_CACHE_SIZE)
         
-        # Invalid company name patterns
-        self.spam_patterns = [
-            r'test\s*company', r'example\s*corp', r'sample\s*ltd', r'dummy\s*business',
-            r'fake\s*enterprise', r'xxx+', r'aaa+', r'lorem\s*ipsum', r'john\s*doe',
-            r'company\s*name', r'business\s*here', r'enter\s*name', r'your\s*company'
-        ]
+        # DNS resolvers and the HTTP session are created on first use, so
+        # importing/constructing the validator doesn't load dnspython or requests
+        self._resolver = None
+        self._async_resolver = None
+        self._session = None
+        self._lazy_lock = threading.Lock()
         
-        # Valid Indian mobile prefixes
-        self.valid_indian_prefixes = {
-            '70', '71', '72', '73', '74', '75', '76', '77', '78', '79',
-            '80', '81', '82', '83', '84', '85', '86', '87', '88', '89',
-            '90', '91', '92', '93', '94', '95', '96', '97', '98', '99'
-        }
+        # DNS token bucket state, shared by the sync and async lookup paths
+        self._dns_tokens = float(self.DNS_BURST)
+        self._dns_refilled_at = time.monotonic()
+        self._dns_lock = threading.Lock()
+        
+        # host -> website check result, bounded and expiring
+        self._site_cache = _TTLCache(self.SITE_CACHE_SIZE)
     
-    def validate_complete_buyer_data(self, buyer_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Complete validation of buyer data with 100% accuracy"""
-        try:
-            # Create validation result
-            validated_buyer = buyer_data.copy()
-            validation_results = {}
-            
-            # 1. Validate Company Name
+    def _get_resolvers(self):
+        """Configured (sync, async) resolvers sharing dnspython's own answer cache"""
+        if self._resolver is None:
+            with self._lazy_lock:
+                if self._resolver is None:
+                    import dns.asyncresolver
+                    import dns.resolver
+                    
+                    dns_cache = dns.resolver.LRUCache(self.DNS_CACHE_SIZE)
+                    self._async_resolver = self._configure_resolver(dns.asyncresolver.Resolver(configure=False), dns_cache)
+                    self._resolver = self._configure_resolver(dns.resolver.Resolver(configure=False), dns_cache)
+        return self._resolver, self._async_resolver
+    
+    def _get_session(self):
+        """Pooled keep-alive session shared by all website checks"""
+        if self._session is None:
+            with self._lazy_lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    session.headers.update(self.HTTP_HEADERS)
+                    self._session = session
+        return self._session
+    
+    def validate_complete_buyer_data(self, buyer_data: Dict[str, Any],
+                                     company_valid: Optional[bool] = None,
+                                     email_result: Optional[Dict[str, Any]] = None,
+                                     phone_result: Optional[Dict[str, Any]] = None,
+                                     website_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Complete validation of buyer data with 100% accuracy (updates buyer_data in place and returns it)
+        
+        Company, email, phone and website results already computed for this buyer's
+        values (e.g. once per distinct value in a batch) can be passed in.
+        """
+        validation_results = {}
+        
+        # 1. Validate Company Name
+        if company_valid is None:
             company_valid = self._validate_company_name(buyer_data.get('company_name', ''))
-            validation_results['company_name_valid'] = company_valid
-            
-            # 2. Validate Email with DNS MX Lookup
+        validation_results['company_name_valid'] = company_valid
+        
+        # 2. Validate Email with DNS MX Lookup
+        if email_result is None:
             email_result = self._validate_email_complete(buyer_data.get('email', ''))
-            validation_results['email_valid'] = email_result['valid']
-            validation_results['email_mx_valid'] = email_result['mx_valid']
-            validation_results['email_disposable'] = email_result['disposable']
-            
-            # 3. Validate Phone Number
+        validation_results['email_valid'] = email_result['valid']
+        validation_results['email_mx_valid'] = email_result['mx_valid']
+        validation_results['email_disposable'] = email_result['disposable']
+        
+        # 3. Validate Phone Number
+        if phone_result is None:
             phone_result = self._validate_phone_complete(buyer_data.get('phone', ''))
-            validation_results['phone_valid'] = phone_result['valid']
-            validation_results['phone_format'] = phone_result['format']
-            validation_results['phone_country'] = phone_result['country']
-            
-            # 4. Validate Website/Domain
+        validation_results['phone_valid'] = phone_result['valid']
+        validation_results['phone_format'] = phone_result['format']
+        validation_results['phone_country'] = phone_result['country']
+        
+        # 4. Validate Website/Domain
+        if website_result is None:
             website_result = self._validate_website_complete(buyer_data.get('website', ''))
-            validation_results['website_valid'] = website_result['valid']
-            validation_results['website_active'] = website_result['active']
-            validation_results['website_status'] = website_result['status']
-            
-            # 5. Calculate overall validation score
-            validation_score = self._calculate_validation_score(validation_results)
-            validation_results['validation_score'] = validation_score
-            
-            # 6. Determine final status
-            is_valid = (
-                company_valid and
-                email_result['valid'] and
-                not email_result['disposable'] and
-                phone_result['valid'] and
-                validation_score >= 80
-            )
-            
-            validation_results['status_verified'] = 'VALID' if is_valid else 'INVALID'
-            validation_results['verification_reason'] = self._get_verification_reason(validation_results)
-            
-            # Add validation data to buyer
-            validated_buyer.update(validation_results)
-            
-            return validated_buyer
-            
-        except Exception as e:
-            self.logger.error(f"Validation error: {str(e)}")
-            buyer_data['status_verified'] = 'ERROR'
-            buyer_data['verification_reason'] = f"Validation error: {str(e)}"
-            return buyer_data
+        validation_results['website_valid'] = website_result['valid']
+        validation_results['website_active'] = website_result['active']
+        validation_results['website_status'] = website_result['status']
+        
+        # 5. Calculate overall validation score
+        validation_score = self._calculate_validation_score(validation_results)
+        validation_results['validation_score'] = validation_score
+        
+        # 6. Determine final status
+        is_valid = (
+            company_valid and
+            email_result['valid'] and
+            not email_result['disposable'] and
+            phone_result['valid'] and
+            validation_score >= 80
+        )
+        
+        validation_results['status_verified'] = 'VALID' if is_valid else 'INVALID'
+        validation_results['verification_reason'] = self._get_verification_reason(validation_results)
+        
+        # Add validation data to buyer
+        buyer_data.update(validation_results)
+        
+        return buyer_data
     
     def _validate_company_name(self, company_name: str) -> bool:
         """Validate company name against spam patterns"""
         if not company_name or len(company_name.strip()) < 3:
             return False
         
-        company_lower = company_name.lower().strip()
-        
         # Check against spam patterns
-        for pattern in self.spam_patterns:
-            if re.search(pattern, company_lower):
-                return False
+        if _SPAM_RE.search(company_name):
+            return False
         
         # Must contain at least one alphabetic character
-        if not re.search(r'[a-zA-Z]', company_name):
+        if not _ALPHA_RE.search(company_name):
             return False
         
         # Check for repeated characters (spam indicator)
-        if re.search(r'(.)\1{4,}', company_name):  # 5 or more repeated chars
+        if _REPEAT_RE.search(company_name):  # 5 or more repeated chars
             return False
         
         return True
     
+    def _validate_company_names(self, company_names: List[str]) -> List[bool]:
+        """Vectorized _validate_company_name: each pattern is one pass over all names"""
+        names = pd.Series(company_names, dtype=object)
+        valid = (
+            (names.str.strip().str.len() >= 3) &
+            ~names.str.contains(_SPAM_RE, na=True) &
+            names.str.contains(_ALPHA_RE, na=False) &
+            # count() rather than contains(): the backreference needs a capture group
+            (names.str.count(_REPEAT_RE) == 0)
+        )
+        return valid.tolist()
+    
     def _validate_email_complete(self, email: str) -> Dict[str, Any]:
         """Complete email validation with DNS MX lookup"""
+        result, domain = self._precheck_email(email)
+        if not domain:
+            return result
+        
+        # DNS MX Lookup (cached per domain)
+        return self._apply_mx_result(result, self._lookup_mx(domain))
+    
+    @staticmethod
+    def _apply_mx_result(result: Dict[str, Any], mx_result: Tuple[bool, str]) -> Dict[str, Any]:
+        """Merge an MX lookup outcome into a prechecked email result"""
+        mx_valid, reason = mx_result
+        result['mx_valid'] = mx_valid
+        result['valid'] = mx_valid
+        result['reason'] = reason
+        return result
+    
+    def _precheck_email(self, email: str) -> Tuple[Dict[str, Any], str]:
+        """Format and disposable checks; returns (result, domain to look up or '')"""
         result = {
             'valid': False,
             'mx_valid': False,
@@ -129,37 +330,111 @@ class AdvancedDataValidator:
         
         if not email or '@' not in email:
             result['reason'] = 'Invalid format'
-            return result
+            return result, ''
         
-        # Basic format validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        # Syntax validation only; deliverability is the cached MX lookup below
+        try:
+            checked = validate_email(email, check_deliverability=False)
+        except EmailNotValidError:
             result['reason'] = 'Invalid email format'
-            return result
+            return result, ''
         
-        # Extract domain
-        domain = email.split('@')[1].lower()
+        # ASCII (IDNA-encoded) domain, usable directly for DNS
+        domain = checked.ascii_domain.lower()
         result['domain'] = domain
         
         # Check for disposable email
-        if domain in self.disposable_domains:
+        if domain in DISPOSABLE_DOMAINS:
             result['disposable'] = True
             result['reason'] = 'Disposable email domain'
-            return result
+            return result, ''
+        
+        return result, domain
+    
+    def _get_cached_mx(self, domain: str) -> Optional[Tuple[bool, str]]:
+        """Return a fresh cached MX result for the domain, if any"""
+        return self._mx_cache.get(domain)
+    
+    def _cache_mx(self, domain: str, mx_valid: bool, reason: str) -> Tuple[bool, str]:
+        """Store an MX result for the domain and return it"""
+        ttl = self.MX_CACHE_TTL if mx_valid else self.MX_NEGATIVE_CACHE_TTL
+        self._mx_cache.set(domain, (mx_valid, reason), ttl)
+        return mx_valid, reason
+    
+    def _store_mx_records(self, domain: str, mx_records) -> Tuple[bool, str]:
+        """Cache the outcome of a successful MX query"""
+        if mx_records:
+            return self._cache_mx(domain, True, 'Valid email with MX record')
+        return self._cache_mx(domain, False, 'No MX record found')
+    
+    def _configure_resolver(self, resolver, cache):
+        """Apply the DNS timeouts, nameservers and answer cache to a resolver"""
+        resolver.nameservers = list(self.DNS_NAMESERVERS)
+        resolver.timeout = self.DNS_TIMEOUT
+        resolver.lifetime = self.DNS_LIFETIME
+        resolver.cache = cache
+        return resolver
+    
+    def _reserve_dns_token(self) -> float:
+        """Take one DNS query token and return how long to wait before issuing it"""
+        with self._dns_lock:
+            now = time.monotonic()
+            elapsed = now - self._dns_refilled_at
+            self._dns_refilled_at = now
+            self._dns_tokens = min(self.DNS_BURST, self._dns_tokens + elapsed * self.DNS_QUERIES_PER_SECOND)
+            self._dns_tokens -= 1
+            if self._dns_tokens >= 0:
+                return 0.0
+            return -self._dns_tokens / self.DNS_QUERIES_PER_SECOND
+    
+    def _lookup_mx(self, domain: str) -> Tuple[bool, str]:
+        """Blocking MX lookup, served from the cache when possible"""
+        cached = self._get_cached_mx(domain)
+        if cached is not None:
+            return cached
         
-        # DNS MX Lookup
+        delay = self._reserve_dns_token()
+        if delay:
+            time.sleep(delay)
+        
+        import dns.exception
+        import dns.resolver
+        
+        resolver, _ = self._get_resolvers()
         try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            if mx_records:
-                result['mx_valid'] = True
-                result['valid'] = True
-                result['reason'] = 'Valid email with MX record'
-            else:
-                result['reason'] = 'No MX record found'
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, Exception) as e:
-            result['reason'] = f'DNS lookup failed: {str(e)}'
+            mx_records = resolver.resolve(domain, 'MX')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            # Definitive negative answers are cached with the shorter TTL
+            return self._cache_mx(domain, False, f'DNS lookup failed: {str(e)}')
+        except dns.exception.DNSException as e:
+            # Timeouts and server failures may be transient, so they are not cached
+            return False, f'DNS lookup failed: {str(e)}'
+        
+        return self._store_mx_records(domain, mx_records)
+    
+    async def _lookup_mx_async(self, domain: str) -> Tuple[bool, str]:
+        """Non-blocking MX lookup, served from the cache when possible"""
+        cached = self._get_cached_mx(domain)
+        if cached is not None:
+            return cached
         
-        return result
+        delay = self._reserve_dns_token()
+        if delay:
+            await asyncio.sleep(delay)
+        
+        import dns.exception
+        import dns.resolver
+        
+        _, resolver = self._get_resolvers()
+        try:
+            mx_records = await resolver.resolve(domain, 'MX')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            return self._cache_mx(domain, False, f'DNS lookup failed: {str(e)}')
+        except dns.exception.DNSException as e:
+            # Timeouts and server failures may be transient, so they are not cached
+            return False, f'DNS lookup failed: {str(e)}'
+        
+        return self._store_mx_records(domain, mx_records)
     
     def _validate_phone_complete(self, phone: str) -> Dict[str, Any]:
         """Complete phone number validation"""
@@ -175,47 +450,111 @@ class AdvancedDataValidator:
             return result
         
         # Clean phone number
-        cleaned_phone = re.sub(r'[^\d+]', '', phone)
+        cleaned_phone = _PHONE_CLEAN_RE.sub('', phone)
         
         # Check for obvious fake numbers
         if len(cleaned_phone) < 10 or cleaned_phone in ['0000000000', '1111111111', '1234567890']:
             result['reason'] = 'Invalid phone pattern'
             return result
         
-        try:
-            # Try to parse with different country codes
-            for country_code in ['IN', 'US', 'GB', None]:
-                try:
-                    parsed_number = phonenumbers.parse(cleaned_phone, country_code)
-                    if phonenumbers.is_valid_number(parsed_number):
-                        result['valid'] = True
-                        result['format'] = phonenumbers.format_number(parsed_number, PhoneNumberFormat.E164)
-                        result['country'] = phonenumbers.region_code_for_number(parsed_number)
-                        result['reason'] = 'Valid phone number'
-                        
-                        # Additional validation for Indian numbers
-                        if result['country'] == 'IN':
-                            mobile_part = result['format'][3:]  # Remove +91
-                            if len(mobile_part) == 10 and mobile_part[:2] in self.valid_indian_prefixes:
-                                result['reason'] = 'Valid Indian mobile number'
-                            else:
-                                result['valid'] = False
-                                result['reason'] = 'Invalid Indian mobile format'
-                        
-                        break
-                except NumberParseException:
-                    continue
-                    
-            if not result['valid']:
-                result['reason'] = 'Could not parse phone number'
-                
-        except Exception as e:
-            result['reason'] = f'Phone validation error: {str(e)}'
+        # Try to parse with the plausible country codes only
+        for country_code in self._candidate_phone_regions(cleaned_phone):
+            parsed = _parse_phone_cached(cleaned_phone, country_code)
+            if parsed is None or not parsed[0]:
+                continue
+            
+            result['valid'] = True
+            result['format'] = parsed[1]
+            result['country'] = parsed[2]
+            result['reason'] = 'Valid phone number'
+            
+            # Additional validation for Indian numbers
+            if result['country'] == 'IN':
+                mobile_part = result['format'][3:]  # Remove +91
+                # Indian mobile numbers start with 70-99
+                if len(mobile_part) == 10 and 70 <= int(mobile_part[:2]) <= 99:
+                    result['reason'] = 'Valid Indian mobile number'
+                else:
+                    result['valid'] = False
+                    result['reason'] = 'Invalid Indian mobile format'
+            
+            break
+        
+        if not result['valid']:
+            result['reason'] = 'Could not parse phone number'
         
         return result
     
+    def _candidate_phone_regions(self, cleaned_phone: str) -> Tuple[Optional[str], ...]:
+        """Regions worth parsing a cleaned phone number with, most likely first"""
+        if cleaned_phone.startswith('+'):
+            # Explicit country code: a single region-less parse is enough
+            return (None,)
+        
+        if len(cleaned_phone) == 10:
+            # Bare 10-digit number: Indian mobile
+            return ('IN',)
+        
+        for prefix, region in self.COUNTRY_CODE_REGIONS:
+            if cleaned_phone.startswith(prefix):
+                return (region,) + tuple(r for r in self.PHONE_REGIONS if r != region)
+        
+        return self.PHONE_REGIONS
+    
     def _validate_website_complete(self, website: str) -> Dict[str, Any]:
         """Complete website validation with HTTP check"""
+        result, url, host = self._prepare_website_check(website)
+        if not url:
+            return result
+        
+        # HTTP status check
+        import requests
+        
+        try:
+            self._record_site_status(result, self._fetch_status(url))
+        except requests.exceptions.Timeout:
+            result['reason'] = 'Website timeout'
+        except requests.exceptions.ConnectionError:
+            result['reason'] = 'Connection failed'
+        except requests.RequestException as e:
+            result['reason'] = f'HTTP check error: {str(e)}'
+        except ValueError:
+            # Malformed or over-long hosts raise urllib3's LocationParseError or UnicodeError
+            result['reason'] = 'Invalid URL format'
+        
+        return self._cache_site(host, result)
+    
+    async def _validate_website_async(self, website: str, session) -> Dict[str, Any]:
+        """Website validation on the event loop with a shared aiohttp session"""
+        result, url, host = self._prepare_website_check(website)
+        if not url:
+            return result
+        
+        import aiohttp
+        
+        timeout = aiohttp.ClientTimeout(total=10)
+        try:
+            async with session.head(url, timeout=timeout, allow_redirects=True) as response:
+                status_code = response.status
+            if status_code in self.HEAD_UNSUPPORTED_STATUSES:
+                # The body is never read, so only the headers are downloaded
+                async with session.get(url, timeout=timeout, allow_redirects=True) as response:
+                    status_code = response.status
+            self._record_site_status(result, status_code)
+        except asyncio.TimeoutError:
+            result['reason'] = 'Website timeout'
+        except aiohttp.ClientConnectionError:
+            result['reason'] = 'Connection failed'
+        except aiohttp.ClientError as e:
+            result['reason'] = f'HTTP check error: {str(e)}'
+        except ValueError:
+            # Scraped hosts like "a..b.com" or over-long labels fail IDNA encoding
+            result['reason'] = 'Invalid URL format'
+        
+        return self._cache_site(host, result)
+    
+    def _prepare_website_check(self, website: str) -> Tuple[Dict[str, Any], str, str]:
+        """Normalize the website; returns (result, URL to fetch, host), with an empty URL when result is final"""
         result = {
             'valid': False,
             'active': False,
@@ -225,7 +564,7 @@ class AdvancedDataValidator:
         
         if not website:
             result['reason'] = 'Empty website'
-            return result
+            return result, '', ''
         
         # Add protocol if missing
         if not website.startswith(('http://', 'https://')):
@@ -236,62 +575,62 @@ class AdvancedDataValidator:
             parsed = urlparse(website)
             if not parsed.netloc:
                 result['reason'] = 'Invalid URL format'
-                return result
-        except Exception:
+                return result, '', ''
+        except ValueError:
             result['reason'] = 'URL parsing error'
-            return result
+            return result, '', ''
         
-        # HTTP status check
+        # Buyers of the same company share a site: check each host once per TTL
+        host = parsed.netloc.lower().removeprefix('www.')
+        cached = self._get_cached_site(host)
+        if cached is not None:
+            return cached, '', ''
+        
+        return result, website, host
+    
+    def _record_site_status(self, result: Dict[str, Any], status_code: int) -> None:
+        """Fill a website check result from the HTTP status"""
+        result['status'] = status_code
+        
+        if 200 <= status_code < 400:
+            result['valid'] = True
+            result['active'] = True
+            result['reason'] = f'Active website (HTTP {status_code})'
+        else:
+            result['reason'] = f'Website error (HTTP {status_code})'
+    
+    def _get_cached_site(self, host: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh cached website check for the host, if any"""
+        return self._site_cache.get(host)
+    
+    def _cache_site(self, host: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a website check for the host and return it"""
+        # No HTTP status means the connection itself failed
+        ttl = self.SITE_CACHE_TTL if result['status'] else self.SITE_FAILURE_CACHE_TTL
+        self._site_cache.set(host, result, ttl)
+        return result
+    
+    def _fetch_status(self, website: str) -> int:
+        """HTTP status of the site without downloading the page body"""
+        import requests
+        
+        session = self._get_session()
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(website, headers=headers, timeout=10, allow_redirects=True)
-            result['status'] = response.status_code
-            
-            if 200 <= response.status_code < 400:
-                result['valid'] = True
-                result['active'] = True
-                result['reason'] = f'Active website (HTTP {response.status_code})'
-            else:
-                result['reason'] = f'Website error (HTTP {response.status_code})'
-                
-        except requests.exceptions.Timeout:
-            result['reason'] = 'Website timeout'
+            response = session.head(website, timeout=10, allow_redirects=True)
+            response.close()
+            if response.status_code not in self.HEAD_UNSUPPORTED_STATUSES:
+                return response.status_code
         except requests.exceptions.ConnectionError:
-            result['reason'] = 'Connection failed'
-        except Exception as e:
-            result['reason'] = f'HTTP check error: {str(e)}'
+            # Some servers drop HEAD requests outright; retry with GET below
+            pass
         
-        return result
+        # GET fallback: stream so only the headers are read, then release the connection
+        with session.get(website, timeout=10, allow_redirects=True, stream=True) as response:
+            return response.status_code
     
     def _calculate_validation_score(self, validation_results: Dict[str, Any]) -> int:
         """Calculate overall validation score (0-100)"""
-        score = 0
-        
-        # Company name (20 points)
-        if validation_results.get('company_name_valid', False):
-            score += 20
-        
-        # Email validation (30 points)
-        if validation_results.get('email_valid', False):
-            score += 20
-            if validation_results.get('email_mx_valid', False):
-                score += 10
-        if not validation_results.get('email_disposable', True):
-            score += 0  # No penalty for non-disposable
-        
-        # Phone validation (25 points)
-        if validation_results.get('phone_valid', False):
-            score += 25
-        
-        # Website validation (25 points)
-        if validation_results.get('website_valid', False):
-            score += 15
-            if validation_results.get('website_active', False):
-                score += 10
-        
-        return min(score, 100)
+        return min(sum(weight for key, weight in VALIDATION_WEIGHTS if validation_results.get(key)), 100)
     
     def _get_verification_reason(self, validation_results: Dict[str, Any]) -> str:
         """Get human-readable verification reason"""
@@ -321,17 +660,62 @@ class AdvancedDataValidator:
         return '; '.join(issues) if issues else 'Low validation score'
     
     def validate_batch_data(self, buyers_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Validate a batch of buyer data"""
-        validated_buyers = []
+        """Validate a batch of buyer data (sync wrapper around validate_batch_async)"""
+        return asyncio.run(self.validate_batch_async(buyers_list))
+    
+    async def validate_batch_async(self, buyers_list: List[Dict[str, Any]],
+                                   max_concurrency: int = 32) -> List[Dict[str, Any]]:
+        """Validate a batch of buyer data with concurrent MX lookups and website checks (buyer dicts are updated in place)"""
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # Validation targets are deduplicated across the batch: each distinct
+        # email domain, phone and website is checked once, then merged per buyer
+        company_names = list({buyer.get('company_name', '') for buyer in buyers_list})
+        emails = {buyer.get('email', '') for buyer in buyers_list}
+        phones = {buyer.get('phone', '') for buyer in buyers_list}
+        websites = list({buyer.get('website', '') for buyer in buyers_list})
+        
+        prechecks = {email: self._precheck_email(email) for email in emails}
+        domains = list({domain for _, domain in prechecks.values() if domain})
+        
+        async def resolve(domain: str) -> Tuple[bool, str]:
+            # The semaphore bounds in-flight DNS queries instead of sleeping per buyer
+            async with semaphore:
+                return await self._lookup_mx_async(domain)
+        
+        # MX lookups and website checks share one event loop; the connector
+        # caps open connections and caches the hosts' A records
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=8, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=self.HTTP_HEADERS) as session:
+            checked = await asyncio.gather(
+                *(self._validate_website_async(website, session) for website in websites),
+                *(resolve(domain) for domain in domains)
+            )
+        website_results = dict(zip(websites, checked[:len(websites)]))
+        mx_results = dict(zip(domains, checked[len(websites):]))
         
-        for buyer in buyers_list:
-            validated_buyer = self.validate_complete_buyer_data(buyer)
-            validated_buyers.append(validated_buyer)
-            
-            # Small delay to avoid overwhelming DNS servers
-            time.sleep(0.1)
+        company_results = dict(zip(company_names, self._validate_company_names(company_names)))
         
-        return validated_buyers
+        # Each email reuses its precheck and its domain's outcome from the async
+        # pass, so transient DNS failures are not retried synchronously here
+        email_results = {
+            email: self._apply_mx_result(result, mx_results[domain]) if domain else result
+            for email, (result, domain) in prechecks.items()
+        }
+        phone_results = {phone: self._validate_phone_complete(phone) for phone in phones}
+        
+        return [
+            self.validate_complete_buyer_data(
+                buyer,
+                company_results[buyer.get('company_name', '')],
+                email_results[buyer.get('email', '')],
+                phone_results[buyer.get('phone', '')],
+                website_results[buyer.get('website', '')]
+            )
+            for buyer in buyers_list
+        ]
     
     def filter_valid_buyers_only(self, buyers_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter to return only 100% valid buyers"""
@@ -349,43 +733,153 @@ class AdvancedDataValidator:
         if not buyers_list:
             return buyers_list
         
-        unique_buyers = []
-        seen_companies = set()
-        seen_emails = set()
-        seen_phones = set()
+        # Exact-match pass: keys are normalized column-at-a-time, then checked in
+        # one set-lookup pass, so the fuzzy pass below only sees the survivors
+        df = pd.DataFrame(buyers_list)
+        companies = self._text_column(df, 'company_name').str.lower().str.strip()
+        emails = self._text_column(df, 'email').str.lower().str.strip()
+        phones = (
+            self._text_column(df, 'phone')
+            .str.encode('ascii', 'ignore').str.decode('ascii')
+            .str.translate(_DIGITS_ONLY)
+        )
+        
+        # Punctuation/spacing-insensitive name key, so "ABC Exports Pvt. Ltd."
+        # and "ABC Exports Pvt Ltd" are caught by hashing, not the fuzzy pass
+        name_keys = companies.str.replace(r'\W+', '', regex=True)
+        
+        # Only kept rows contribute keys: a row dropped for its name must not
+        # knock out a later, different company that shares its email or phone
+        keep = np.ones(len(df), dtype=bool)
+        seen_names, seen_emails, seen_phones = set(), set(), set()
+        for i, (name_key, email, phone) in enumerate(zip(name_keys, emails, phones)):
+            if name_key in seen_names or email in seen_emails or (len(phone) >= 10 and phone in seen_phones):
+                keep[i] = False
+                continue
+            if name_key:
+                seen_names.add(name_key)
+            if email:
+                seen_emails.add(email)
+            if phone:
+                seen_phones.add(phone)
+        
+        # Fuzzy pass over the surviving named rows: similar-name pairs are
+        # clustered, and only the first row of each cluster is kept
+        named = np.flatnonzero(keep & (companies != '').to_numpy())
+        pairs = self._similar_name_pairs(companies.to_numpy()[named].tolist())
+        if pairs:
+            rows, cols = np.array(pairs).T
+            graph = csr_matrix((np.ones(len(pairs), dtype=np.int8), (rows, cols)), shape=(len(named), len(named)))
+            _, labels = connected_components(graph, directed=False)
+            keep[named[pd.Series(labels).duplicated().to_numpy()]] = False
+        
+        unique_buyers = [buyer for buyer, kept in zip(buyers_list, keep) if kept]
         
-        for buyer in buyers_list:
-            company_name = buyer.get('company_name', '').lower().strip()
-            email = buyer.get('email', '').lower().strip()
-            phone = re.sub(r'[^\d]', '', buyer.get('phone', ''))
-            
-            # Skip if we've seen this exact company, email, or phone
-            is_duplicate = False
+        removed_count = len(buyers_list) - len(unique_buyers)
+        self.logger.info(f"Removed {removed_count} duplicates from {len(buyers_list)} buyers")
+        
+        return unique_buyers
+    
+    def _similar_name_pairs(self, company_names: List[str]) -> List[Tuple[int, int]]:
+        """Index pairs of names at or above FUZZY_NAME_THRESHOLD, scored group by group"""
+        names = np.array(company_names, dtype=object)
+        lengths = np.array([len(name) for name in company_names])
+        threshold = self.FUZZY_NAME_THRESHOLD
+        pairs = []
+        
+        for group in self._candidate_groups(company_names):
+            left, right = np.triu_indices(len(group), k=1)
+            left, right = group[left], group[right]
             
-            if company_name and company_name in seen_companies:
-                is_duplicate = True
-            elif email and email in seen_emails:
-                is_duplicate = True
-            elif phone and len(phone) >= 10 and phone in seen_phones:
-                is_duplicate = True
-            else:
-                # Fuzzy matching for similar company names
-                for seen_company in seen_companies:
-                    similarity = SequenceMatcher(None, company_name, seen_company).ratio()
-                    if similarity > 0.85:  # 85% similarity threshold
-                        is_duplicate = True
-                        break
+            # fuzz.ratio is at most 1 - |la - lb| / (la + lb), so pairs whose
+            # lengths differ too much are dropped before any edit-distance work
+            feasible = np.abs(lengths[left] - lengths[right]) <= (1 - threshold) * (lengths[left] + lengths[right])
+            left, right = left[feasible], right[feasible]
+            if not len(left):
+                continue
             
-            if not is_duplicate:
-                unique_buyers.append(buyer)
-                if company_name:
-                    seen_companies.add(company_name)
-                if email:
-                    seen_emails.add(email)
-                if phone:
-                    seen_phones.add(phone)
+            # Element-wise scores for the surviving pairs, in multi-threaded C;
+            # below-cutoff scores come back as 0
+            scores = process.cpdist(
+                names[left], names[right],
+                scorer=fuzz.ratio,
+                dtype=np.uint8,
+                workers=-1,
+                score_cutoff=threshold * 100
+            )
+            similar = scores > 0
+            pairs.extend(zip(left[similar].tolist(), right[similar].tolist()))
         
-        removed_count = len(buyers_list) - len(unique_buyers)
-        self.logger.info(f"Removed {removed_count} duplicates from {len(buyers_list)} buyers")
+        return pairs
+    
+    def _candidate_groups(self, company_names: List[str]) -> List[np.ndarray]:
+        """Index groups that may hold duplicates: connected components of the LSH candidate graph"""
+        lsh = MinHashLSH(threshold=self.LSH_THRESHOLD, num_perm=self.LSH_NUM_PERM)
+        rows, cols = [], []
+        
+        # MinHash.generator shares one set of permutations and hashes each
+        # name's shingles in a single numpy batch, instead of per shingle
+        minhashes = MinHash.generator(
+            (self._name_shingles(company_name) for company_name in company_names),
+            num_perm=self.LSH_NUM_PERM
+        )
+        for j, minhash in enumerate(minhashes):
+            for i in lsh.query(minhash):
+                rows.append(i)
+                cols.append(j)
+            lsh.insert(j, minhash)
+        
+        if not rows:
+            return []
+        
+        size = len(company_names)
+        graph = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(size, size))
+        _, labels = connected_components(graph, directed=False)
+        
+        # Split indices by component label; names without any candidate need no scoring
+        groups = self._split_by_key(np.arange(size), labels)
+        
+        # LSH candidates chain into very large components on generic names
+        # ("... spices pvt ltd"); block those by 3-character prefix instead
+        blocked = []
+        for group in groups:
+            if len(group) <= self.MAX_CANDIDATE_GROUP:
+                blocked.append(group)
+            else:
+                prefixes = np.array([company_names[i][:3] for i in group], dtype=object)
+                blocked.extend(self._split_by_key(group, prefixes))
         
-        return unique_buyers
\ No newline at end of file
+        return blocked
+    
+    @staticmethod
+    def _split_by_key(indices: np.ndarray, keys: np.ndarray) -> List[np.ndarray]:
+        """Split indices into groups sharing a key, dropping singletons"""
+        codes = pd.factorize(keys)[0]
+        order = np.argsort(codes, kind='stable')
+        groups = np.split(indices[order], np.flatnonzero(np.diff(codes[order])) + 1)
+        return [group for group in groups if len(group) > 1]
+    
+    @staticmethod
+    def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+        """Column as strings with missing values blanked ('' if the column is absent)"""
+        if column not in df.columns:
+            return pd.Series('', index=df.index)
+        return df[column].fillna('').astype(str)
+    
+    @staticmethod
+    def _name_shingles(company_name: str) -> List[bytes]:
+        """Distinct character 3-shingles of a company name, encoded for MinHash"""
+        shingles = {company_name[i:i + 3] for i in range(len(company_name) - 2)} or {company_name}
+        return [shingle.encode('utf8') for shingle in shingles]
+
+_default_validator: Optional[AdvancedDataValidator] = None
+_default_validator_lock = threading.Lock()
+
+def get_default_validator() -> AdvancedDataValidator:
+    """Process-wide validator, created on first use, so caches and pooled connections are shared"""
+    global _default_validator
+    if _default_validator is None:
+        with _default_validator_lock:
+            if _default_validator is None:
+                _default_validator = AdvancedDataValidator()
+    return _default_validator
\ No newline at end of file
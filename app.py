@@ -1,12 +1,19 @@
 import streamlit as st
 import pandas as pd
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import time
+import re
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import os
 from robust_scraper import HyperTurmericBuyerScraper
 from data_processor import DataProcessor
-from advanced_validator import AdvancedDataValidator
-from utils import export_to_csv, validate_url
+from advanced_validator import get_default_validator
+from utils import build_search_blob, export_to_csv, export_to_excel
 
 # Set page configuration
 st.set_page_config(
@@ -21,6 +28,74 @@ if 'scraped_data' not in st.session_state:
     st.session_state.scraped_data = pd.DataFrame()
 if 'scraping_in_progress' not in st.session_state:
     st.session_state.scraping_in_progress = False
+if 'scraped_data_version' not in st.session_state:
+    st.session_state.scraped_data_version = 0
+if 'scrape_notice' not in st.session_state:
+    st.session_state.scrape_notice = None
+if 'scrape_job' not in st.session_state:
+    st.session_state.scrape_job = None
+
+def set_scraped_data(df):
+    """Replace the dataset and bump its version (the key for cached derived data)"""
+    st.session_state.scraped_data = df
+    # Nanosecond stamp rather than a counter: st.cache_data is shared by all sessions
+    st.session_state.scraped_data_version = time.time_ns()
+
+@st.cache_data(show_spinner=False)
+def get_search_blob(_df, version):
+    """Search blob for a dataset version, built once per version"""
+    return build_search_blob(_df)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def parse_search_terms(raw_terms):
+    """One term per non-blank line, whitespace-collapsed, without case-insensitive repeats"""
+    seen = set()
+    terms = []
+    for line in raw_terms.splitlines():
+        term = ' '.join(line.split())
+        if term and term.lower() not in seen:
+            seen.add(term.lower())
+            terms.append(term)
+    return terms
+
+@st.cache_resource
+def get_scraper(delay_seconds):
+    """Scraper (and its pooled session) reused across reruns, one per delay setting"""
+    return HyperTurmericBuyerScraper(delay_seconds=delay_seconds)
+
+@st.cache_resource
+def get_processor():
+    """Data processor reused across reruns"""
+    return DataProcessor()
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_csv_bytes(_df, version):
+    """CSV export for a dataset version (written by pyarrow)"""
+    return export_to_csv(_df)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_json_bytes(_df, version):
+    """JSON export for a dataset version (orjson serializes the records in C)"""
+    if orjson is None:
+        return _df.to_json(orient='records', indent=2)
+    return orjson.dumps(
+        _df.to_dict(orient='records'),
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+def _json_default(value):
+    """orjson fallback for values of Arrow-backed columns: pd.NA and pd.Timestamp"""
+    if value is pd.NA:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return str(value)
+    raise TypeError
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_excel_bytes(_df, version):
+    """Excel workbook for a dataset version"""
+    return export_to_excel(_df, sheet_name='Turmeric Buyers')
 
 def main():
     st.title("🌿 ULTRA-FAST Turmeric Buyer Intelligence Platform")
@@ -119,7 +194,7 @@ def main():
         
         # Clear data button
         if st.button("🗑️ Clear All Data", type="secondary"):
-            st.session_state.scraped_data = pd.DataFrame()
+            set_scraped_data(pd.DataFrame())
             st.success("Data cleared successfully!")
             st.rerun()
     
@@ -135,6 +210,14 @@ def main():
         else:
             st.info("📭 No data collected yet")
         
+        # Outcome of the scrape that triggered this rerun, shown once
+        if st.session_state.scrape_notice:
+            level, message, celebrate = st.session_state.scrape_notice
+            st.session_state.scrape_notice = None
+            getattr(st, level)(message)
+            if celebrate:
+                st.balloons()
+        
         # Start scraping button
         if st.button(
             "🚀 Start Scraping",
@@ -143,20 +226,13 @@ def main():
             use_container_width=True
         ):
             start_scraping(target_count, delay_seconds, search_terms, use_tradeindia, use_indiamart, use_exportersindia, use_zauba, use_tofler, use_government, use_alibaba, min_validation_score)
+        
+        # Runs while a background scrape is active
+        if st.session_state.scrape_job is not None:
+            scrape_progress()
     
     with col2:
-        st.subheader("📋 Quick Stats")
-        if not st.session_state.scraped_data.empty:
-            df = st.session_state.scraped_data
-            
-            # Display metrics
-            col_a, col_b = st.columns(2)
-            with col_a:
-                st.metric("Total Companies", len(df))
-                st.metric("With Email", len(df[df['email'].notna()]))
-            with col_b:
-                st.metric("With Phone", len(df[df['phone'].notna()]))
-                st.metric("With Website", len(df[df['website'].notna()]))
+        quick_stats()
     
     # Data display and management
     if not st.session_state.scraped_data.empty:
@@ -173,7 +249,7 @@ def start_scraping(target_count, delay_seconds, search_terms, use_tradeindia, us
     st.session_state.scraping_in_progress = True
     
     # Parse search terms
-    terms_list = [term.strip() for term in search_terms.split('\n') if term.strip()]
+    terms_list = parse_search_terms(search_terms)
     
     # Configure advanced sources
     sources = []
@@ -203,115 +279,229 @@ def start_scraping(target_count, delay_seconds, search_terms, use_tradeindia, us
         return
     
     # Initialize ULTRA-FAST scraper with AI-powered search
-    scraper = HyperTurmericBuyerScraper(delay_seconds=delay_seconds)  # 300x faster global scraping
-    data_processor = DataProcessor()
-    data_validator = AdvancedDataValidator()  # 100% validation system
-    
-    # Progress containers
-    progress_container = st.container()
-    
-    with progress_container:
-        st.subheader("🚀 Ultra-Fast AI Scraping in Progress")
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        results_container = st.empty()
+    scraper = get_scraper(delay_seconds)  # 300x faster global scraping
+    data_validator = get_default_validator()  # 100% validation system (shared across runs)
+    
+    # Scrape, dedupe and validate on the background worker; scrape_progress polls the job
+    job = ScrapeJob(target_count)
+    job.future = get_scrape_executor().submit(
+        run_scrape_job, job, scraper, data_validator, terms_list, target_count, sources
+    )
+    st.session_state.scrape_job = job
+    st.rerun()
+
+class ScrapeJob:
+    """Progress of one background scrape, written by the worker thread and read by the UI"""
+    
+    def __init__(self, target_count):
+        self.target_count = target_count
+        self.start_ns = time.perf_counter_ns()
+        self.future = None
+        self._lock = threading.Lock()
+        self._stage = "🤖 Initializing robust scraper with fallback system..."
+        self._progress = 0.0
+        self._preview = []
+    
+    def elapsed(self):
+        """Seconds since the job was submitted (monotonic clock)"""
+        return (time.perf_counter_ns() - self.start_ns) / 1e9
+    
+    def update(self, stage=None, progress=None, preview=None):
+        """Record a progress step (called from the worker thread)"""
+        with self._lock:
+            if stage is not None:
+                self._stage = stage
+            if progress is not None:
+                self._progress = progress
+            if preview is not None:
+                self._preview = preview
+    
+    def snapshot(self):
+        """Current (stage, progress, preview records)"""
+        with self._lock:
+            return self._stage, self._progress, self._preview
+
+@st.cache_resource
+def get_scrape_executor():
+    """Single background worker shared by all sessions, so scrape runs queue instead of overlapping"""
+    return ThreadPoolExecutor(max_workers=1)
+
+def run_scrape_job(job, scraper, data_validator, terms_list, target_count, sources):
+    """Scrape, dedupe and validate off the script thread; returns (collected count, valid buyers, scrape time)"""
+    # Raw records as they arrive; only the last few are kept for the preview
+    raw_buffer = []
+    
+    def on_pair_done(done, total, found):
+        # Scraping is the first half of the progress bar
+        job.update(f"🔍 Scraped {done}/{total} term/source pairs • {found} companies so far...", 0.5 * done / total)
+    
+    def on_pair_results(companies):
+        raw_buffer.extend(companies)
+        job.update(preview=raw_buffer[-5:])
+    
+    # All (term, source) pairs are scraped concurrently; results stream in as they finish
+    collected_data = scraper.scrape_buyers(
+        terms_list,
+        target_count=target_count,
+        sources=sources,
+        progress_callback=on_pair_done,
+        results_callback=on_pair_results
+    )
+    
+    # Calculate scraping time
+    scrape_time = job.elapsed()
+    
+    if not collected_data:
+        return 0, [], scrape_time
+    
+    # STEP 1: Remove duplicates
+    job.update(f"🔍 Found {len(collected_data)} companies in {scrape_time:.2f}s, removing duplicates...", 0.5)
+    unique_data = data_validator.remove_duplicates_advanced(collected_data)
+    
+    # STEP 2: 100% validation of each buyer
+    job.update(f"✅ Validating {len(unique_data)} companies with 100% accuracy...", 0.75)
+    validated_data = data_validator.validate_batch_data(unique_data)
+    
+    # STEP 3: Filter only 100% valid buyers
+    valid_buyers = data_validator.filter_valid_buyers_only(validated_data)
+    
+    return len(collected_data), valid_buyers, scrape_time
+
+@st.fragment(run_every=0.5)
+def scrape_progress():
+    """Live view of the background scrape; hands the result to the full app once it is done"""
+    job = st.session_state.scrape_job
+    stage, progress, preview = job.snapshot()
+    
+    st.subheader("🚀 Ultra-Fast AI Scraping in Progress")
+    st.progress(progress)
+    st.text(stage)
+    if preview:
+        st.dataframe(pd.DataFrame.from_records(preview), use_container_width=True)
+    
+    if job.future.done():
+        finish_scraping(job)
+        st.rerun()
+
+def finish_scraping(job):
+    """Process and merge a finished job's buyers, leaving the outcome in scrape_notice"""
+    target_count = job.target_count
+    
+    try:
+        collected_count, valid_buyers, scrape_time = job.future.result()
         
-        try:
-            # Start timing
-            start_time = time.time()
+        if not collected_count:
+            st.session_state.scrape_notice = ('warning', "⚠️ No companies found. Please try different search terms.", False)
+        elif valid_buyers:
+            data_processor = get_processor()
+            processed_df = data_processor.process_data(valid_buyers)
             
-            # ROBUST scraping with error handling and fallback
-            status_text.text("🤖 Initializing robust scraper with fallback system...")
+            # Merge with existing data
+            if not st.session_state.scraped_data.empty:
+                set_scraped_data(data_processor.merge_dataframes(
+                    st.session_state.scraped_data, 
+                    processed_df
+                ))
+            else:
+                set_scraped_data(processed_df)
             
-            # Use the robust scraper method
-            collected_data = scraper.scrape_buyers(terms_list, target_count=target_count)
+            # Final validation check with complete timing
+            valid_count = int((processed_df['status_verified'] == 'VALID').sum()) if 'status_verified' in processed_df.columns else 0
+            final_time = job.elapsed()
             
-            # Calculate scraping time
-            scrape_time = time.time() - start_time
+            # Detailed performance stats, rendered by the rerun that follows
+            speed = len(valid_buyers) / max(final_time, 0.1)
+            summary = (
+                f"🎯 COMPLETED: {valid_count} valid buyers found in {final_time:.2f} seconds! ({speed:.1f} companies/sec)\n\n"
+                f"⏱️ Waktu Scraping: {scrape_time:.2f} detik ({scrape_time/60:.1f} menit) | Speed: {collected_count/max(scrape_time, 0.1):.1f} companies/sec"
+            )
             
-            if collected_data:
-                status_text.text(f"🔍 Found {len(collected_data)} companies in {scrape_time:.2f}s, starting validation...")
-                progress_bar.progress(0.5)
-                
-                # Display timing info
-                st.info(f"⏱️ Waktu Scraping: {scrape_time:.2f} detik ({scrape_time/60:.1f} menit) | Speed: {len(collected_data)/max(scrape_time, 0.1):.1f} companies/sec")
-                
-                # Save to fast formats
-                scraper.save_to_fast_formats(collected_data)
-                
-                # STEP 1: Remove duplicates
-                status_text.text(f"🔍 Removing duplicates from {len(collected_data)} companies...")
-                unique_data = data_validator.remove_duplicates_advanced(collected_data)
-                
-                # STEP 2: 100% validation of each buyer
-                status_text.text(f"✅ Validating {len(unique_data)} companies with 100% accuracy...")
-                validated_data = data_validator.validate_batch_data(unique_data)
-                
-                # STEP 3: Filter only 100% valid buyers
-                valid_buyers = data_validator.filter_valid_buyers_only(validated_data)
-                
-                # Update progress
-                progress = min(len(collected_data) / target_count, 1.0)
-                progress_bar.progress(progress)
-                
-                # Show validation statistics with timing
-                total_time = time.time() - start_time
-                validation_stats = f"✅ Robust Scraping: {len(valid_buyers)} VALID buyers from {len(collected_data)} total • Time: {total_time:.2f}s • Target: {target_count}"
-                status_text.text(validation_stats)
-                
-                # Show results with validation details
-                if valid_buyers:
-                    df_temp = data_processor.process_data(valid_buyers[-5:])  # Show last 5 valid results
-                    if not df_temp.empty:
-                        results_container.dataframe(df_temp, use_container_width=True)
+            if valid_count >= target_count:
+                st.session_state.scrape_notice = ('success', summary, True)
+            elif valid_count >= target_count // 2:
+                st.session_state.scrape_notice = ('warning', f"{summary}\n\n⚠️ Partial success: target was {target_count}. Consider running again for more data.", False)
             else:
-                st.warning("⚠️ No companies found. Please try different search terms.")
-                valid_buyers = []
+                st.session_state.scrape_notice = ('info', f"{summary}\n\n📊 You may want to adjust search terms or try again.", False)
             
-            # Process and save data
-            if valid_buyers:
-                processed_df = data_processor.process_data(valid_buyers)
-                
-                # Merge with existing data
-                if not st.session_state.scraped_data.empty:
-                    st.session_state.scraped_data = data_processor.merge_dataframes(
-                        st.session_state.scraped_data, 
-                        processed_df
-                    )
-                else:
-                    st.session_state.scraped_data = processed_df
-                
-                # Final validation check with complete timing
-                valid_count = len([buyer for buyer in valid_buyers if buyer.get('status_verified') == 'VALID'])
-                final_time = time.time() - start_time
-                
-                status_text.text(f"✅ Robust Scraping completed! Collected {len(valid_buyers)} companies ({valid_count} 100% validated) in {final_time:.2f}s.")
-                progress_bar.progress(1.0)
-                
-                # Display detailed performance stats
-                speed = len(valid_buyers) / max(final_time, 0.1)
-                st.success(f"🎯 COMPLETED: {valid_count} valid buyers found in {final_time:.2f} seconds! ({speed:.1f} companies/sec)")
-                
-                if valid_count >= target_count:
-                    st.balloons()
-                elif valid_count >= target_count // 2:
-                    st.warning(f"⚠️ Partial success: {valid_count} valid buyers found (target was {target_count}). Consider running again for more data.")
-                else:
-                    st.info(f"📊 Collected {valid_count} valid buyers. You may want to adjust search terms or try again.")
-                
-            else:
-                st.warning("⚠️ No data was collected. Please try different search terms or sources.")
-                
-        except Exception as e:
-            st.error(f"❌ An error occurred during scraping: {str(e)}")
+        else:
+            st.session_state.scrape_notice = ('warning', "⚠️ No data was collected. Please try different search terms or sources.", False)
+            
+    except Exception as e:
+        st.session_state.scrape_notice = ('error', f"❌ An error occurred during scraping: {str(e)}", False)
+    
+    finally:
+        st.session_state.scrape_job = None
+        st.session_state.scraping_in_progress = False
+
+_REGEX_META = re.compile(r'[.^$*+?{}\[\]\\|()]')
+
+def _search_mask(search_blob, search_query):
+    """Rows whose blob contains the query: a regex if it uses metacharacters, else a plain substring"""
+    if _REGEX_META.search(search_query):
+        try:
+            return search_blob.str.contains(search_query, case=False, regex=True, na=False)
+        except (re.error, ValueError):
+            pass  # Not a valid pattern ("abc(", "c++"), so search for it literally
+    return search_blob.str.contains(search_query.lower(), regex=False, na=False)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def filtered_positions(_df, version, search_query, selected_city, sort_by):
+    """Positions of the rows matching the search and city filter, in the chosen order"""
+    # Both filters are combined into one mask; rows are only copied by the caller's final slice
+    mask = None
+    
+    if search_query:
+        # One scan over the cached, pre-lowered blob instead of three case-insensitive scans
+        search_blob = get_search_blob(_df, version)
+        mask = _search_mask(search_blob, search_query)
+    
+    if selected_city != 'All':
+        city_mask = _df['city'] == selected_city
+        mask = city_mask if mask is None else mask & city_mask
+    
+    # Sort data: filtering the presorted positions keeps them in order, so a new query never re-sorts
+    order = get_sort_order(_df, version, sort_by)
+    if mask is not None:
+        order = order[mask.to_numpy(dtype=bool)[order]]
+    
+    # Caching positions rather than the frame keeps cache hits to a small array copy
+    return order
+
+# Sort option -> (column, ascending)
+SORT_KEYS = {
+    'Company Name': ('company_name', True),
+    'City': ('city', True),
+    'Date Added': ('date_added', False)
+}
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_sort_order(_df, version, sort_by):
+    """Row positions of the whole dataset in the chosen order, computed once per dataset version"""
+    column, ascending = SORT_KEYS[sort_by]
+    return _df[column].reset_index(drop=True).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+
+@st.fragment
+def quick_stats():
+    """Summary metrics for the current dataset"""
+    st.subheader("📋 Quick Stats")
+    if not st.session_state.scraped_data.empty:
+        df = st.session_state.scraped_data
         
-        finally:
-            st.session_state.scraping_in_progress = False
-            time.sleep(2)
-            st.rerun()
+        # Non-null counts for all three columns in one pass
+        counts = df[['email', 'phone', 'website']].count()
+        
+        # Display metrics
+        col_a, col_b = st.columns(2)
+        with col_a:
+            st.metric("Total Companies", len(df))
+            st.metric("With Email", int(counts['email']))
+        with col_b:
+            st.metric("With Phone", int(counts['phone']))
+            st.metric("With Website", int(counts['website']))
 
+@st.fragment
 def display_data_section():
-    """Display and manage scraped data"""
+    """Display and manage scraped data (a fragment: its filter widgets rerun only this section)"""
     st.subheader("📋 Collected Data")
     
     df = st.session_state.scraped_data
@@ -324,52 +514,35 @@ def display_data_section():
     
     with col2:
         # City filter
-        cities = ['All'] + sorted(df['city'].dropna().unique().tolist())
+        # Categories are kept sorted and pruned by DataProcessor.optimize_dtypes
+        cities = ['All'] + list(df['city'].cat.categories)
         selected_city = st.selectbox("🏙️ Filter by City:", cities)
     
     with col3:
         # Sort options
-        sort_options = ['Company Name', 'City', 'Date Added']
+        sort_options = list(SORT_KEYS)
         sort_by = st.selectbox("📊 Sort by:", sort_options)
     
-    # Apply filters
-    filtered_df = df.copy()
-    
-    if search_query:
-        mask = (
-            filtered_df['company_name'].str.contains(search_query, case=False, na=False) |
-            filtered_df['city'].str.contains(search_query, case=False, na=False) |
-            filtered_df['description'].str.contains(search_query, case=False, na=False)
-        )
-        filtered_df = filtered_df[mask]
-    
-    if selected_city != 'All':
-        filtered_df = filtered_df[filtered_df['city'] == selected_city]
-    
-    # Sort data
-    if sort_by == 'Company Name':
-        filtered_df = filtered_df.sort_values('company_name')
-    elif sort_by == 'City':
-        filtered_df = filtered_df.sort_values('city')
-    elif sort_by == 'Date Added':
-        filtered_df = filtered_df.sort_values('date_added', ascending=False)
+    # Apply filters and sort (cached per dataset version and widget values)
+    positions = filtered_positions(df, st.session_state.scraped_data_version, search_query, selected_city, sort_by)
     
     # Display results count
-    st.info(f"📊 Showing {len(filtered_df)} of {len(df)} companies")
+    st.info(f"📊 Showing {len(positions)} of {len(df)} companies")
     
     # Display data
-    if not filtered_df.empty:
+    if len(positions):
         # Column selection for display
         display_columns = st.multiselect(
             "Select columns to display:",
-            options=filtered_df.columns.tolist(),
+            options=df.columns.tolist(),
             default=['company_name', 'city', 'phone', 'email', 'website'],
             key="display_columns"
         )
         
         if display_columns:
+            # Rows and columns are selected in one slice
             st.dataframe(
-                filtered_df[display_columns],
+                df.iloc[positions, df.columns.get_indexer(display_columns)],
                 use_container_width=True,
                 hide_index=True
             )
@@ -378,18 +551,21 @@ def display_data_section():
     else:
         st.warning("No data matches your search criteria.")
 
+@st.fragment
 def export_section():
-    """Handle data export functionality"""
+    """Handle data export functionality (export clicks rerun only this section)"""
     st.subheader("📤 Export Data")
     
+    # One timestamp for all three file names
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # CSV Export
         if st.button("📊 Export as CSV", use_container_width=True):
             try:
-                csv_data = export_to_csv(st.session_state.scraped_data)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                csv_data = get_csv_bytes(st.session_state.scraped_data, st.session_state.scraped_data_version)
                 filename = f"turmeric_buyers_{timestamp}.csv"
                 
                 st.download_button(
@@ -403,20 +579,17 @@ def export_section():
                 st.error(f"Error exporting CSV: {str(e)}")
     
     with col2:
-        # Excel Export (using CSV for simplicity)
+        # Excel Export
         if st.button("📈 Export as Excel", use_container_width=True):
             try:
-                # Convert to Excel format
-                from io import BytesIO
-                output = BytesIO()
-                st.session_state.scraped_data.to_excel(output, sheet_name='Turmeric Buyers', index=False, engine='openpyxl')
+                # Convert to Excel format (cached until the dataset changes)
+                excel_data = get_excel_bytes(st.session_state.scraped_data, st.session_state.scraped_data_version)
                 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"turmeric_buyers_{timestamp}.xlsx"
                 
                 st.download_button(
                     label="⬇️ Download Excel",
-                    data=output.getvalue(),
+                    data=excel_data,
                     file_name=filename,
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                     use_container_width=True
@@ -428,8 +601,7 @@ def export_section():
         # JSON Export
         if st.button("🔗 Export as JSON", use_container_width=True):
             try:
-                json_data = st.session_state.scraped_data.to_json(orient='records', indent=2)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                json_data = get_json_bytes(st.session_state.scraped_data, st.session_state.scraped_data_version)
                 filename = f"turmeric_buyers_{timestamp}.json"
                 
                 st.download_button(
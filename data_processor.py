@@ -1,12 +1,47 @@
 import pandas as pd
+import numpy as np
 import re
 from datetime import datetime
 import logging
 from typing import List, Dict, Any
 
+# Copy-on-Write lets process_data clean a caller's DataFrame without a deep copy up front
+# (always on, and the option deprecated, from pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# Cleaning patterns, compiled once per process
+# Surrounding whitespace plus a leading "M/s" / "Messrs" prefix, removed in one pass
+_NAME_TRIM_RE = re.compile(r'^\s*(?:(?:M/s\.?|Messrs\.?)\s*)?|\s+$', re.IGNORECASE)
+_NULLISH_RE = re.compile(r'(?:nan|none|null)$', re.IGNORECASE)
+_NON_PHONE_RE = re.compile(r'[^\d+]')
+_INDIAN_PHONE_RE = re.compile(r'^(?:\+91|91)?0?(\d{10})$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 class DataProcessor:
     """Process and clean scraped company data"""
     
+    # Low-cardinality columns stored as categoricals: equality filters and sorts
+    # compare integer codes, and the sorted categories double as filter choices
+    CATEGORICAL_COLUMNS = ['city', 'country', 'source', 'status_verified']
+    
+    # Free-text columns, kept as Arrow strings even when every value is missing
+    TEXT_COLUMNS = [
+        'company_name', 'contact_person', 'state', 'phone', 'email',
+        'website', 'products', 'description', 'company_url'
+    ]
+    
+    # Points per filled-in column in the data quality score
+    QUALITY_WEIGHTS = {
+        'company_name': 3,  # Company name (required)
+        'phone': 2,  # Contact information
+        'email': 2,
+        'city': 1,  # Location information
+        'state': 1,
+        'website': 1,  # Additional information
+        'contact_person': 1
+    }
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
@@ -15,7 +50,8 @@ class DataProcessor:
         try:
             # Convert to DataFrame safely
             if isinstance(raw_data, pd.DataFrame):
-                df = raw_data.copy()
+                # Shallow copy: under Copy-on-Write the data is only copied if a column is modified in place
+                df = raw_data.copy(deep=False)
             elif isinstance(raw_data, list):
                 df = pd.DataFrame(raw_data)
             elif isinstance(raw_data, dict):
@@ -39,7 +75,7 @@ class DataProcessor:
             # Reorder columns
             df = self._reorder_columns(df)
             
-            return df
+            return self.optimize_dtypes(df)
             
         except Exception as e:
             self.logger.error(f"Error processing data: {str(e)}")
@@ -48,18 +84,12 @@ class DataProcessor:
     def _clean_company_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize company names"""
         if 'company_name' in df.columns:
-            # Remove extra whitespace and normalize
-            df['company_name'] = df['company_name'].astype(str).str.strip()
-            
-            # Remove common prefixes/suffixes for better matching
-            df['company_name'] = df['company_name'].str.replace(r'^(M/s\.?|Messrs\.?)\s*', '', regex=True, case=False)
+            # Remove extra whitespace and common prefixes, then capitalize properly
+            names = df['company_name'].astype(str).str.replace(_NAME_TRIM_RE, '', regex=True).str.title()
+            df['company_name'] = names
             
-            # Capitalize properly
-            df['company_name'] = df['company_name'].str.title()
-            
-            # Remove entries with invalid names
-            df = df[df['company_name'].str.len() > 2]
-            df = df[~df['company_name'].str.contains(r'(?:nan|none|null)$', case=False, na=False)]
+            # Remove entries with invalid names (one combined mask)
+            df = df[(names.str.len() > 2) & ~names.str.contains(_NULLISH_RE, na=False)]
         
         return df
     
@@ -67,57 +97,24 @@ class DataProcessor:
         """Clean and standardize phone numbers"""
         if 'phone' in df.columns:
             # Remove non-digit characters except +
-            df['phone'] = df['phone'].astype(str).str.replace(r'[^\d+]', '', regex=True)
-            
-            # Standardize Indian phone numbers
-            def standardize_phone(phone):
-                if pd.isna(phone) or phone in ['nan', 'none', '']:
-                    return ''
-                
-                phone = str(phone).strip()
-                
-                # Remove country code if present
-                if phone.startswith('+91'):
-                    phone = phone[3:]
-                elif phone.startswith('91') and len(phone) > 10:
-                    phone = phone[2:]
-                
-                # Validate length
-                if len(phone) == 10 and phone.isdigit():
-                    return '+91-' + phone
-                elif len(phone) == 11 and phone.startswith('0'):
-                    return '+91-' + phone[1:]
-                else:
-                    return ''
+            phones = df['phone'].astype(str).str.replace(_NON_PHONE_RE, '', regex=True)
             
-            df['phone'] = df['phone'].apply(standardize_phone)
+            # Standardize Indian phone numbers: an optional +91/91 country code and
+            # trunk 0 around exactly 10 digits; anything else does not match
+            local_numbers = phones.str.extract(_INDIAN_PHONE_RE, expand=False)
             
-            # Remove invalid phone numbers
-            df.loc[df['phone'] == '', 'phone'] = None
+            # Invalid phone numbers stay missing
+            df['phone'] = '+91-' + local_numbers
         
         return df
     
     def _clean_email_addresses(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate email addresses"""
         if 'email' in df.columns:
-            # Email validation regex
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+            emails = df['email'].astype('string').str.strip().str.lower()
             
-            def validate_email(email):
-                if pd.isna(email) or email in ['nan', 'none', '']:
-                    return ''
-                
-                email = str(email).strip().lower()
-                
-                if re.match(email_pattern, email):
-                    return email
-                else:
-                    return ''
-            
-            df['email'] = df['email'].apply(validate_email)
-            
-            # Remove invalid emails
-            df.loc[df['email'] == '', 'email'] = None
+            # Invalid emails are left missing
+            df['email'] = emails.where(emails.str.match(_EMAIL_RE, na=False))
         
         return df
     
@@ -125,19 +122,24 @@ class DataProcessor:
         """Clean and standardize location data"""
         for col in ['city', 'state']:
             if col in df.columns:
+                # Locations repeat heavily, so each distinct value is cleaned once and mapped back
+                codes, locations = pd.factorize(df[col], use_na_sentinel=False)
+                
                 # Clean and standardize
-                df[col] = df[col].astype(str).str.strip().str.title()
+                locations = pd.Series(locations, dtype=object).astype(str).str.strip().str.title()
                 
                 # Remove invalid entries
-                df.loc[df[col].str.contains(r'(?:nan|none|null)$', case=False, na=False), col] = None
-                df.loc[df[col].str.len() <= 1, col] = None
+                invalid = locations.str.contains(_NULLISH_RE, na=False) | (locations.str.len() <= 1)
+                locations = locations.mask(invalid, None)
+                
+                df[col] = locations.to_numpy()[codes]
         
         return df
     
     def _add_metadata(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add metadata columns"""
-        # Add timestamp
-        df['date_added'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Add timestamp (a real datetime column, so sorting compares integers, not strings)
+        df['date_added'] = pd.Timestamp(datetime.now()).floor('s')
         
         # Add data quality score
         df['data_quality_score'] = self._calculate_quality_score(df)
@@ -146,26 +148,12 @@ class DataProcessor:
     
     def _calculate_quality_score(self, df: pd.DataFrame) -> pd.Series:
         """Calculate data quality score for each row"""
-        scores = pd.Series(0, index=df.index)
+        columns = [col for col in self.QUALITY_WEIGHTS if col in df.columns]
+        weights = np.array([self.QUALITY_WEIGHTS[col] for col in columns], dtype=np.int64)
         
-        # Company name (required)
-        scores += df['company_name'].notna().astype(int) * 3
-        
-        # Contact information
-        scores += df['phone'].notna().astype(int) * 2
-        scores += df['email'].notna().astype(int) * 2
-        
-        # Location information
-        scores += df['city'].notna().astype(int) * 1
-        scores += df['state'].notna().astype(int) * 1
-        
-        # Additional information
-        if 'website' in df.columns:
-            scores += df['website'].notna().astype(int) * 1
-        if 'contact_person' in df.columns:
-            scores += df['contact_person'].notna().astype(int) * 1
-        
-        return scores
+        # One presence matrix (rows x scored columns) times the weight vector
+        present = df[columns].notna().to_numpy(dtype=np.int64)
+        return pd.Series(present @ weights, index=df.index)
     
     def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """Remove duplicate companies"""
@@ -177,12 +165,18 @@ class DataProcessor:
         
         # Remove duplicates based on company name similarity
         if 'company_name' in df.columns:
-            # Sort by data quality score (descending) to keep best records
             if 'data_quality_score' in df.columns:
-                df = df.sort_values('data_quality_score', ascending=False)
-            
-            # Remove duplicates based on company name
-            df = df.drop_duplicates(subset=['company_name'], keep='first')
+                # Keep the best-scored record per company with one hashed pass over the
+                # score column, instead of sorting the whole frame first. On a RangeIndex
+                # idxmax returns positions, so a caller's repeated labels can't pull in extra rows
+                df = df.reset_index(drop=True)
+                best = df.groupby('company_name', sort=False, dropna=False)['data_quality_score'].idxmax()
+                
+                # Only the survivors are sorted, best first
+                df = df.take(best.to_numpy()).sort_values('data_quality_score', ascending=False, kind='stable')
+            else:
+                # Remove duplicates based on company name
+                df = df.drop_duplicates(subset=['company_name'], keep='first')
         
         return df.reset_index(drop=True)
     
@@ -206,30 +200,56 @@ class DataProcessor:
         
         return df[final_order]
     
+    def optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store columns as Arrow-backed dtypes, with low-cardinality columns as pruned categoricals"""
+        # Arrow strings are contiguous buffers instead of one Python object per cell
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+        
+        # An all-missing column infers as null[pyarrow], which rejects string values (fillna(''))
+        for col in self.TEXT_COLUMNS + self.CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('string[pyarrow]')
+        
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category').cat.remove_unused_categories()
+        
+        return df
+    
     def merge_dataframes(self, existing_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
         """Merge new data with existing data, removing duplicates"""
+        return self.merge_many([existing_df, new_df])
+    
+    def merge_many(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """Merge processed frames (oldest first) with one concat, keeping the best record per company"""
         try:
-            if existing_df.empty:
-                return new_df
+            frames = [frame for frame in frames if not frame.empty]
             
-            if new_df.empty:
-                return existing_df
+            if not frames:
+                return pd.DataFrame()
             
-            # Combine dataframes
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+            if len(frames) == 1:
+                return frames[0]
             
-            # Remove duplicates
-            combined_df = self._remove_duplicates(combined_df)
+            # Combine dataframes (buffer chunks and merge them here once, not pairwise)
+            combined_df = pd.concat(frames, ignore_index=True)
             
-            # Sort by data quality score and date
+            # Sort by data quality score and date, so the best record of each company comes first
             if 'data_quality_score' in combined_df.columns:
                 combined_df = combined_df.sort_values(
                     ['data_quality_score', 'date_added'], 
-                    ascending=[False, False]
+                    ascending=[False, False],
+                    kind='stable'
                 )
             
-            return combined_df.reset_index(drop=True)
+            # Remove duplicates with a single hashed pass on the key column
+            # (all inputs are already processed, so no full-row comparison is needed)
+            if 'company_name' in combined_df.columns:
+                combined_df = combined_df.drop_duplicates(subset=['company_name'], keep='first')
+            
+            # concat falls back to object dtype when the category sets differ
+            return self.optimize_dtypes(combined_df.reset_index(drop=True))
             
         except Exception as e:
             self.logger.error(f"Error merging dataframes: {str(e)}")
-            return existing_df
+            return frames[0]
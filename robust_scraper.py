@@ -1,3 +1,4 @@
+import asyncio
 import requests
 import cloudscraper
 from bs4 import BeautifulSoup
@@ -5,11 +6,17 @@ import re
 import random
 import time
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Callable
 from urllib.parse import urljoin, urlparse, quote
 import json
 from fake_useragent import UserAgent
 from retrying import retry
+from aiolimiter import AsyncLimiter
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 import pandas as pd
 import sqlite3
 from datetime import datetime
@@ -49,6 +56,12 @@ class RobustTurmericScraper:
         # Cache untuk menghindari duplicate scraping
         self.scraped_urls = set()
         
+        # Worker threads scrape_buyers_async berbagi stats, scraped_urls dan rotasi proxy
+        self._state_lock = threading.Lock()
+        
+        # Di-set saat target tercapai, supaya worker yang sedang berjalan berhenti lebih awal
+        self._stop_event = threading.Event()
+        
         # Data sources dengan fallback mechanism
         self.data_sources = [
             {
@@ -148,8 +161,9 @@ class RobustTurmericScraper:
         if not self.proxy_list:
             return None
             
-        proxy = self.proxy_list[self.current_proxy_index]
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_list)
+        with self._state_lock:
+            proxy = self.proxy_list[self.current_proxy_index]
+            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxy_list)
         
         if proxy:
             return {
@@ -174,15 +188,22 @@ class RobustTurmericScraper:
             'Cache-Control': 'max-age=0'
         }
     
-    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000)
+    def _increment_stat(self, key: str, amount: int = 1):
+        """Tambah counter stats secara thread-safe"""
+        with self._state_lock:
+            self.stats[key] += amount
+    
+    @retry(stop_max_attempt_number=3, wait_exponential_multiplier=1000, wait_exponential_max=10000, wait_jitter_max=1000)
     def make_request(self, url: str, params: Dict = None) -> Optional[str]:
         """Make HTTP request dengan retry mechanism dan error handling"""
         try:
-            self.stats['total_requests'] += 1
+            self._increment_stat('total_requests')
             
             # Skip jika URL sudah pernah di-scrape
             url_key = f"{url}?{str(params)}" if params else url
-            if url_key in self.scraped_urls:
+            with self._state_lock:
+                already_scraped = url_key in self.scraped_urls
+            if already_scraped:
                 self.logger.debug(f"Skipping already scraped URL: {url}")
                 return None
             
@@ -190,13 +211,11 @@ class RobustTurmericScraper:
             headers = self.get_random_headers()
             proxies = self.get_next_proxy()
             
-            # Update session headers
-            self.session.headers.update(headers)
-            
-            # Make request
+            # Make request (headers per request, session dipakai bersama oleh worker threads)
             response = self.session.get(
                 url, 
                 params=params,
+                headers=headers,
                 proxies=proxies,
                 timeout=15,
                 allow_redirects=True
@@ -204,14 +223,17 @@ class RobustTurmericScraper:
             
             # Check response
             if response.status_code == 200:
-                self.stats['successful_requests'] += 1
-                self.scraped_urls.add(url_key)
+                with self._state_lock:
+                    self.stats['successful_requests'] += 1
+                    self.scraped_urls.add(url_key)
                 self.logger.info(f"✅ Success: {url} - Status: {response.status_code}")
                 return response.text
             
             elif response.status_code in [403, 429]:
                 self.logger.warning(f"⚠️  Rate limited or blocked: {url} - Status: {response.status_code}")
-                time.sleep(random.uniform(2, 5))  # Wait longer for rate limits
+                # Hormati Retry-After dari server (maksimal 30 detik), kalau tidak ada tunggu acak
+                retry_after = response.headers.get('Retry-After', '')
+                time.sleep(min(int(retry_after), 30) if retry_after.isdigit() else random.uniform(2, 5))
                 raise Exception(f"Rate limited: {response.status_code}")
             
             elif response.status_code == 404:
@@ -223,8 +245,9 @@ class RobustTurmericScraper:
                 raise Exception(f"HTTP {response.status_code}")
                 
         except Exception as e:
-            self.stats['failed_requests'] += 1
-            self.stats['retries_used'] += 1
+            with self._state_lock:
+                self.stats['failed_requests'] += 1
+                self.stats['retries_used'] += 1
             self.logger.error(f"❌ Request failed: {url} - Error: {str(e)}")
             
             # Random delay sebelum retry
@@ -258,7 +281,7 @@ class RobustTurmericScraper:
                     company_data = self._extract_single_company(element, source_config, search_term)
                     if company_data and self._validate_company_data(company_data):
                         companies.append(company_data)
-                        self.stats['companies_found'] += 1
+                        self._increment_stat('companies_found')
                         
                 except Exception as e:
                     self.logger.debug(f"Error extracting single company: {str(e)}")
@@ -417,22 +440,59 @@ class RobustTurmericScraper:
         
         return True
     
+    def _scrape_source_with_fallback(self, source_config: Dict, search_term: str, allow_retry: bool) -> List[Dict[str, Any]]:
+        """Scrape satu source; jika kosong, auto retry dengan variasi keyword"""
+        try:
+            companies = self.scrape_source(source_config, search_term)
+            
+            if companies:
+                self.logger.info(f"✅ {source_config['name']}: Found {len(companies)} companies")
+                return companies
+            
+            self.logger.warning(f"⚠️  {source_config['name']}: No companies found for '{search_term}'")
+            
+            # Auto retry dengan keyword variation jika hasil kosong
+            if allow_retry:
+                retry_terms = [
+                    f"bulk {search_term}",
+                    f"{search_term} importer",
+                    f"{search_term} wholesale"
+                ]
+                
+                for retry_term in retry_terms:
+                    if self._stop_event.is_set():
+                        break
+                    self.logger.info(f"🔄 Auto retry with: {retry_term}")
+                    retry_companies = self.scrape_source(source_config, retry_term)
+                    if retry_companies:
+                        self.logger.info(f"✅ Retry success: Found {len(retry_companies)} companies")
+                        return retry_companies
+        
+        except Exception as e:
+            self.logger.error(f"❌ Error with {source_config['name']}: {str(e)}")
+        
+        return []
+    
     def scrape_source(self, source_config: Dict, search_term: str, max_pages: int = 3) -> List[Dict[str, Any]]:
         """Scrape single source dengan pagination dan error handling"""
         all_companies = []
         
+        # Search URL sama untuk semua page; hanya params yang berubah
+        search_url = f"{source_config['base_url']}{source_config['search_path']}"
+        
         try:
             for page in range(1, max_pages + 1):
+                if self._stop_event.is_set():
+                    break
+                
                 self.logger.info(f"🔍 Scraping {source_config['name']} - Term: {search_term} - Page: {page}")
                 
-                # Build search URL
+                # Build search params
                 search_params = {
                     'ss': search_term,
                     'page': page
                 }
                 
-                search_url = f"{source_config['base_url']}{source_config['search_path']}"
-                
                 # Make request dengan retry
                 html_content = self.make_request(search_url, search_params)
                 
@@ -448,16 +508,36 @@ class RobustTurmericScraper:
                     self.logger.warning(f"Failed to get content for page {page}")
                     break
                 
-                # Delay antar page
-                time.sleep(random.uniform(self.delay_seconds, self.delay_seconds * 2))
+                # Delay antar page (langsung selesai kalau scrape dihentikan)
+                self._stop_event.wait(random.uniform(self.delay_seconds, self.delay_seconds * 2))
                 
         except Exception as e:
             self.logger.error(f"❌ Error scraping {source_config['name']} for {search_term}: {str(e)}")
         
         return all_companies
     
-    def scrape_buyers(self, search_terms: List[str], target_count: int = 50) -> List[Dict[str, Any]]:
+    def scrape_buyers(self, search_terms: List[str], target_count: int = 50,
+                      sources: Optional[List[str]] = None,
+                      progress_callback: Optional[Callable[[int, int, int], None]] = None,
+                      results_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None) -> List[Dict[str, Any]]:
         """Main scraping method dengan fallback dan error recovery"""
+        # uvloop (kalau terpasang) punya event loop yang lebih cepat dari asyncio bawaan
+        run = uvloop.run if uvloop is not None else asyncio.run
+        return run(self.scrape_buyers_async(search_terms, target_count, sources, progress_callback, results_callback))
+    
+    async def scrape_buyers_async(self, search_terms: List[str], target_count: int = 50,
+                                  sources: Optional[List[str]] = None,
+                                  progress_callback: Optional[Callable[[int, int, int], None]] = None,
+                                  results_callback: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+                                  max_concurrency: int = 8,
+                                  max_rate: float = 20) -> List[Dict[str, Any]]:
+        """Scrape semua pasangan (term, source) secara concurrent
+        
+        Paling banyak max_concurrency pasangan berjalan bersamaan, dan paling banyak
+        max_rate pasangan dimulai per detik untuk setiap host (host berbeda tidak saling menunggu).
+        progress_callback(done, total, companies_found) dipanggil setiap kali satu pasangan selesai,
+        dan results_callback(companies) menerima hasil mentah pasangan tersebut.
+        """
         start_time = time.time()
         all_companies = []
         
@@ -472,6 +552,10 @@ class RobustTurmericScraper:
             'retries_used': 0,
             'start_time': start_time
         }
+        # URL yang sudah diambil hanya berlaku untuk satu run; scraper yang di-cache
+        # dipakai ulang antar run, jadi run baru harus bisa mengambil URL yang sama lagi
+        self.scraped_urls = set()
+        self._stop_event.clear()
         
         # Use AI keywords jika search terms kosong
         if not search_terms or search_terms == ['']:
@@ -480,52 +564,66 @@ class RobustTurmericScraper:
         
         # Scrape each source dengan fallback
         active_sources = [s for s in self.data_sources if s['enabled']]
+        if sources is not None:
+            known_names = {s['name'] for s in active_sources}
+            unknown_names = [name for name in sources if name not in known_names]
+            if unknown_names:
+                self.logger.warning(f"⚠️  Source belum didukung, diabaikan: {', '.join(unknown_names)}")
+            
+            selected_sources = [s for s in active_sources if s['name'] in sources]
+            if selected_sources:
+                active_sources = selected_sources
+            else:
+                # Tidak ada source yang dikenal: pakai semua source aktif, bukan hasil kosong
+                self.logger.warning("⚠️  Tidak ada source yang didukung dipilih, memakai semua source aktif")
         active_sources.sort(key=lambda x: x['priority'])
         
-        for search_term in search_terms:
-            if len(all_companies) >= target_count:
-                break
-                
-            self.logger.info(f"🔍 Processing search term: {search_term}")
-            
-            for source_config in active_sources:
-                if len(all_companies) >= target_count:
-                    break
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiters = {
+            urlparse(source_config['base_url']).netloc: AsyncLimiter(max_rate, 1)
+            for source_config in active_sources
+        }
+        
+        async def bounded_scrape(search_term: str, source_config: Dict) -> List[Dict[str, Any]]:
+            # Semaphore membatasi request yang berjalan bersamaan; scrape_source
+            # blocking, jadi dijalankan di worker thread
+            async with semaphore:
+                # Token bucket per host menggantikan sleep antar source
+                await limiters[urlparse(source_config['base_url']).netloc].acquire()
+                return await asyncio.to_thread(
+                    self._scrape_source_with_fallback,
+                    source_config,
+                    search_term,
+                    search_term == search_terms[0]  # Hanya retry pada search term pertama
+                )
+        
+        tasks = [
+            asyncio.create_task(bounded_scrape(search_term, source_config))
+            for search_term in search_terms
+            for source_config in active_sources
+        ]
+        
+        try:
+            # Hasil diproses sesuai urutan selesai, berhenti begitu target tercapai
+            for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                companies = await next_result
+                all_companies.extend(companies)
                 
-                try:
-                    companies = self.scrape_source(source_config, search_term)
-                    
-                    if companies:
-                        all_companies.extend(companies)
-                        self.logger.info(f"✅ {source_config['name']}: Found {len(companies)} companies")
-                    else:
-                        self.logger.warning(f"⚠️  {source_config['name']}: No companies found for '{search_term}'")
-                        
-                        # Auto retry dengan keyword variation jika hasil kosong
-                        if search_term == search_terms[0]:  # Hanya retry pada search term pertama
-                            retry_terms = [
-                                f"bulk {search_term}",
-                                f"{search_term} importer",
-                                f"{search_term} wholesale"
-                            ]
-                            
-                            for retry_term in retry_terms:
-                                if len(all_companies) >= target_count:
-                                    break
-                                    
-                                self.logger.info(f"🔄 Auto retry with: {retry_term}")
-                                retry_companies = self.scrape_source(source_config, retry_term)
-                                if retry_companies:
-                                    all_companies.extend(retry_companies)
-                                    self.logger.info(f"✅ Retry success: Found {len(retry_companies)} companies")
-                                    break
+                if results_callback and companies:
+                    results_callback(companies)
                 
-                except Exception as e:
-                    self.logger.error(f"❌ Error with {source_config['name']}: {str(e)}")
-                    continue  # Fallback ke source berikutnya
+                if progress_callback:
+                    progress_callback(done, len(tasks), len(all_companies))
                 
-                # Delay antar source
-                time.sleep(random.uniform(0.5, 1.5))
+                if len(all_companies) >= target_count:
+                    break
+        finally:
+            # Cancel hanya menghentikan pasangan yang belum mulai; thread yang sudah
+            # berjalan tidak bisa di-cancel, jadi mereka berhenti lewat stop event
+            self._stop_event.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
         # Remove duplicates
         unique_companies = self._remove_duplicates(all_companies)
@@ -0,0 +1,34 @@
+import asyncio
+
+from advanced_validator import AdvancedDataValidator
+
+
+def test_remove_duplicates_ignores_keys_of_dropped_rows():
+    buyers = [
+        {'company_name': 'Alpha Spices', 'email': 'sales@alphaspices.com', 'phone': '+91-9876543210'},
+        {'company_name': 'Alpha Spices', 'email': 'info@zetaspices.com', 'phone': '+91-9123456780'},
+        {'company_name': 'Zeta Spices', 'email': 'info@zetaspices.com', 'phone': '+91-9123456780'},
+    ]
+    
+    unique = AdvancedDataValidator().remove_duplicates_advanced(buyers)
+    
+    assert [buyer['company_name'] for buyer in unique] == ['Alpha Spices', 'Zeta Spices']
+
+
+def test_validate_batch_async_survives_unencodable_website():
+    buyers = [
+        {'company_name': 'Alpha Spices Pvt Ltd', 'website': 'https://a..b.com'},
+        {'company_name': 'Zeta Spices Pvt Ltd', 'website': 'https://' + 'a' * 70 + '.com'},
+    ]
+    
+    results = asyncio.run(AdvancedDataValidator().validate_batch_async(buyers))
+    
+    assert len(results) == 2
+    assert not any(result['website_active'] for result in results)
+
+
+def test_validate_website_complete_rejects_unparseable_host():
+    result = AdvancedDataValidator()._validate_website_complete('https://a..b.com')
+    
+    assert not result['valid']
+    assert result['reason'] == 'Invalid URL format'
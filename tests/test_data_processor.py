@@ -0,0 +1,17 @@
+import pandas as pd
+
+from data_processor import DataProcessor
+
+
+def test_remove_duplicates_keeps_best_record_per_company_best_first():
+    df = pd.DataFrame({
+        'company_name': ['Alpha Spices', 'Zeta Spices', 'Alpha Spices', 'Haldi Exports'],
+        'city': ['Mumbai', 'Chennai', 'Pune', 'Kochi'],
+        'data_quality_score': [40, 70, 90, 55],
+    }, index=[0, 0, 1, 1])
+    
+    result = DataProcessor()._remove_duplicates(df)
+    
+    assert result['company_name'].tolist() == ['Alpha Spices', 'Zeta Spices', 'Haldi Exports']
+    assert result['city'].tolist() == ['Pune', 'Chennai', 'Kochi']
+    assert result.index.tolist() == [0, 1, 2]
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+from robust_scraper import RobustTurmericScraper
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    # Logs and saved results are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    scraper = RobustTurmericScraper()
+    scraper.scraped_sources = []
+    
+    def fake_scrape(source_config, search_term, allow_retry):
+        scraper.scraped_sources.append(source_config['name'])
+        return []
+    
+    monkeypatch.setattr(scraper, '_scrape_source_with_fallback', fake_scrape)
+    monkeypatch.setattr(scraper, 'save_results', lambda results: None)
+    return scraper
+
+
+def test_unknown_sources_fall_back_to_all_enabled_sources(scraper):
+    asyncio.run(scraper.scrape_buyers_async(['turmeric'], target_count=5, sources=['zauba', 'tofler']))
+    
+    assert sorted(scraper.scraped_sources) == ['exportersindia', 'indiamart', 'tradeindia']
+
+
+def test_unknown_sources_are_ignored_next_to_known_ones(scraper):
+    asyncio.run(scraper.scrape_buyers_async(['turmeric'], target_count=5, sources=['indiamart', 'alibaba']))
+    
+    assert scraper.scraped_sources == ['indiamart']
+
+
+def test_running_workers_stop_once_target_is_reached(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    scraper = RobustTurmericScraper(delay_seconds=0)
+    requested = []
+    
+    def fake_request(url, params=None):
+        requested.append(url)
+        time.sleep(0.5 if 'indiamart' in url else 0.05)
+        return '<html></html>'
+    
+    monkeypatch.setattr(scraper, 'make_request', fake_request)
+    monkeypatch.setattr(scraper, 'extract_company_data',
+                        lambda html, source_config, term: [{'company_name': f"{source_config['name']} buyer"}])
+    monkeypatch.setattr(scraper, 'save_results', lambda results: None)
+    
+    asyncio.run(scraper.scrape_buyers_async(['turmeric'], target_count=1, sources=['tradeindia', 'indiamart']))
+    
+    # The slow indiamart worker was mid-request when tradeindia hit the target, so it skips its later pages
+    assert sum('indiamart' in url for url in requested) == 1
@@ -0,0 +1,61 @@
+from io import BytesIO
+
+import pandas as pd
+
+from data_processor import DataProcessor
+from utils import build_search_blob, export_to_csv, export_to_excel
+
+
+def test_export_to_excel_round_trip():
+    df = pd.DataFrame({
+        'company_name': ['Spice Traders Ltd', 'Golden Root Imports', 'Haldi Exports'],
+        'city': ['Mumbai', 'Chennai', 'Kochi'],
+        'email': ['info@spicetraders.com', 'sales@goldenroot.in', 'trade@haldi.co'],
+        'data_quality_score': [92, 75, 40],
+    })
+    
+    result = pd.read_excel(BytesIO(export_to_excel(df, sheet_name='Turmeric Buyers')),
+                           sheet_name='Turmeric Buyers')
+    
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_export_to_excel_keeps_urls_as_text():
+    df = pd.DataFrame({
+        'company_name': ['Spice Traders Ltd', 'Golden Root Imports'],
+        'website': ['https://spicetraders.com/' + 'a' * 2100, 'https://goldenroot.in'],
+    })
+    
+    result = pd.read_excel(BytesIO(export_to_excel(df)))
+    
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_search_blob_with_all_null_text_column():
+    df = DataProcessor().optimize_dtypes(pd.DataFrame({
+        'company_name': ['Spice Traders Ltd', 'Golden Root Imports'],
+        'city': ['Mumbai', None],
+        'description': [None, None],
+    }))
+    
+    blob = build_search_blob(df)
+    
+    assert blob.str.contains('spice', regex=False).tolist() == [True, False]
+    assert blob.str.contains('mumbai', regex=False).tolist() == [True, False]
+
+
+def test_export_to_csv_matches_to_csv():
+    df = DataProcessor().process_data([
+        {'company_name': 'alpha spices, ltd', 'email': 'sales@alphaspices.com', 'phone': '9876543210',
+         'city': 'Mumbai', 'description': 'Bulk "Salem" turmeric'},
+        {'company_name': 'zeta foods', 'email': '', 'phone': '', 'city': None,
+         'description': None, 'website': 'https://zetafoods.com'},
+    ])
+    
+    exported = export_to_csv(df)
+    
+    assert df['date_added'].iloc[0].strftime('%Y-%m-%d %H:%M:%S') in exported.decode('utf-8')
+    pd.testing.assert_frame_equal(
+        pd.read_csv(BytesIO(exported)),
+        pd.read_csv(BytesIO(df.to_csv(index=False).encode('utf-8')))
+    )
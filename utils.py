@@ -1,16 +1,59 @@
 import pandas as pd
 import re
+from io import BytesIO
 from urllib.parse import urlparse
 from typing import Optional
 import streamlit as st
 
-def export_to_csv(df: pd.DataFrame) -> str:
-    """Export DataFrame to CSV string"""
+def export_to_csv(df: pd.DataFrame) -> bytes:
+    """Export DataFrame to CSV bytes (pyarrow's C writer, pandas as fallback)"""
     try:
-        return df.to_csv(index=False)
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return df.to_csv(index=False).encode('utf-8')
+        
+        # Timestamps as DataFrame.to_csv writes them; Arrow's writer would append fractional seconds
+        datetime_columns = df.select_dtypes(include=['datetime']).columns
+        if len(datetime_columns):
+            df = df.assign(**{
+                col: df[col].astype('datetime64[us]').dt.strftime('%Y-%m-%d %H:%M:%S')
+                for col in datetime_columns
+            })
+        
+        buffer = pa.BufferOutputStream()
+        pa_csv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            buffer,
+            pa_csv.WriteOptions(quoting_style='needed')
+        )
+        return buffer.getvalue().to_pybytes()
     except Exception as e:
         st.error(f"Error exporting to CSV: {str(e)}")
-        return ""
+        return b""
+
+def export_to_excel(df: pd.DataFrame, sheet_name: str = 'Sheet1') -> bytes:
+    """Export DataFrame to Excel bytes (xlsxwriter, openpyxl as fallback)"""
+    output = BytesIO()
+    try:
+        # No constant_memory: it only keeps the current row, while pandas writes column by column
+        writer = pd.ExcelWriter(output, engine='xlsxwriter', engine_kwargs={'options': {'strings_to_urls': False}})
+    except ImportError:
+        # openpyxl is always installed, just much slower on large sheets
+        writer = pd.ExcelWriter(output, engine='openpyxl')
+    with writer:
+        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    return output.getvalue()
+
+def build_search_blob(df: pd.DataFrame) -> pd.Series:
+    """Lower-cased company name, city and description per row"""
+    # '\x1f' (unit separator) can't be typed into the search box, so matches never span fields
+    return (
+        df['company_name'].astype('string').fillna('') + '\x1f' +
+        df['city'].astype('string').fillna('') + '\x1f' +
+        df['description'].astype('string').fillna('')
+    ).str.lower()
 
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL"""